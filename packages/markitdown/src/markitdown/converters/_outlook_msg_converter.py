@@ -1,10 +1,19 @@
+import io
+import os
+import re
 import sys
-from typing import Any, Union, BinaryIO
+import threading
+from codecs import utf_16_le_decode
+from html import unescape
+from html.entities import html5
+from typing import Any, Dict, List, Optional, Tuple, BinaryIO, TYPE_CHECKING
 from .._stream_info import StreamInfo
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
-from markdownify import markdownify as Markdownify
 
+# markdownify (and, through it, BeautifulSoup) is only imported once an HTML body needs converting
+if TYPE_CHECKING:
+    from markdownify import MarkdownConverter
 
 # Try loading optional (but in this case, required) dependencies
 # Save reporting of any exceptions for later
@@ -22,6 +31,118 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".msg"]
 
+# The headers added to the markdown, in order, as (label, stream, address stream).
+# The value of the address stream, if any, is appended in angle brackets.
+# From: this got wrong fields from O365 MSG: "__substg1.0_0C1F001F"
+# Instead, get the name from '__substg1.0_0C1A001F, and then email address from __substg1.0_5D01001F
+MSG_SUBJECT_STREAM = "__substg1.0_0037001F"
+MSG_HEADERS: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    ("From", "__substg1.0_0C1A001F", "__substg1.0_5D01001F"),
+    ("To", "__substg1.0_0E04001F", None),
+    ("Subject", MSG_SUBJECT_STREAM, None),
+)
+
+# The plain text body; if it is missing, the HTML body is used instead
+MSG_BODY_STREAM = "__substg1.0_1000001F"
+MSG_HTML_BODY_STREAM = "__substg1.0_10130102"
+
+# The text streams read (and decoded) up front: all the headers, and the plain text body
+MSG_TEXT_STREAMS = [
+    stream_path
+    for _, *stream_paths in MSG_HEADERS
+    for stream_path in stream_paths
+    if stream_path is not None
+] + [MSG_BODY_STREAM]
+
+# Signature at the start of every OLE2 (Compound File Binary) file
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# HTML bodies shorter than this many characters (code units: 16 bytes as 8-bit text,
+# 32 bytes as UTF-16-LE) are stubs such as "<html></html>", so they are skipped
+# without decoding them
+MIN_HTML_LENGTH = 16
+
+# Number of bytes at the start of the HTML stream in which to look for HTML markers
+HTML_SNIFF_SIZE = 16384
+
+# Common HTML markers that should appear in valid HTML, as 8-bit text and as UTF-16-LE
+# (where each ASCII character is followed by a NUL; \b does not work across the NULs)
+_HTML_MARKER_RE = re.compile(rb"<(?:html|body|head|div)\b", re.IGNORECASE)
+_HTML_MARKER_UTF16_RE = re.compile(
+    rb"<\x00(?:h\x00t\x00m\x00l|b\x00o\x00d\x00y|h\x00e\x00a\x00d|d\x00i\x00v)\x00(?!\w\x00)",
+    re.IGNORECASE,
+)
+
+# HTML bodies using only these tags carry nothing but paragraphs, line breaks and
+# preformatted text, so they are converted directly rather than through Markdownify
+# (with the same result: see _trivial_html_to_markdown)
+TRIVIAL_HTML_TAGS = {"html", "head", "body", "p", "br", "pre"}
+
+# A start or end tag (captured as: "/" for end tags, name, "/" if self-closing), or a doctype
+_HTML_TOKEN_RE = re.compile(
+    r"<(/?)([a-z][a-z0-9]*)\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*?(/?)>|<!doctype\b[^>]*>",
+    re.IGNORECASE,
+)
+
+# The elements a trivial HTML body steps through, as (open element, tag): new open element
+# ("" being outside <head> and <body>)
+_TRIVIAL_HTML_TRANSITIONS = {
+    ("", "head"): "head",
+    ("head", "/head"): "",
+    ("", "body"): "body",
+    ("body", "/body"): "",
+    ("body", "p"): "p",
+    ("p", "/p"): "body",
+    ("body", "pre"): "pre",
+    ("pre", "/pre"): "body",
+}
+
+# Text made of nothing but these is collapsed by BeautifulSoup (outside <pre>)
+HTML_ASCII_WHITESPACE = " \n\t\x0c\r"
+
+# Markdownify's whitespace normalization of text, and stripping of <pre> text
+_MD_NEWLINE_WHITESPACE_RE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_MD_WHITESPACE_RE = re.compile(r"[\t ]+")
+_MD_PRE_LSTRIP_RE = re.compile(r"^[ \n]*\n")
+_MD_PRE_RSTRIP_RE = re.compile(r"[ \n]*$")
+
+# An ampersand, and the ;-terminated character reference it starts, if any
+_HTML_REFERENCE_RE = re.compile(
+    r"&(?:#([0-9]{1,7});|#[xX]([0-9a-fA-F]{1,6});|([A-Za-z][A-Za-z0-9]*;))?"
+)
+
+# The shape Outlook uses for pasted plain text: a single <pre> block, and nothing else
+# (outside <body>, only whitespace holding a line break, which Markdownify drops)
+_HTML_PRE_ONLY_RE = re.compile(
+    r"(?:[ \n\t\f\r]*\n[ \n\t\f\r]*)?".join(
+        [
+            "",
+            r"<html[^>]*>",
+            r"<body[^>]*>\s*<pre[^>]*>([^<]*)</pre\s*>\s*</body\s*>",
+            r"</html\s*>",
+            "",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# A single MarkdownConverter, built on first use and shared by all conversions,
+# so that its options are not re-parsed for each message
+_markdown_converter: Optional["MarkdownConverter"] = None
+_markdown_converter_lock = threading.Lock()
+
+
+def _get_markdown_converter() -> "MarkdownConverter":
+    """Returns the shared MarkdownConverter, importing markdownify and creating it on first use."""
+    global _markdown_converter
+    if _markdown_converter is None:
+        with _markdown_converter_lock:
+            if _markdown_converter is None:
+                from markdownify import MarkdownConverter
+
+                _markdown_converter = MarkdownConverter()
+    return _markdown_converter
+
 
 class OutlookMsgConverter(DocumentConverter):
     """Converts Outlook .msg files to markdown by extracting email metadata and content.
@@ -29,8 +150,19 @@ class OutlookMsgConverter(DocumentConverter):
     Uses the olefile package to parse the .msg file structure and extract:
     - Email headers (From, To, Subject)
     - Email body content
+
+    NOTE: accepts() hands the OLE file it parsed over to the convert() call that follows,
+    so a single instance must not be shared by threads converting concurrently. To convert
+    many files in parallel, use convert_many(), which runs each file in its own process.
     """
 
+    def __init__(self):
+        super().__init__()
+        # OLE files parsed while sniffing in accepts(), keyed by id(file_stream), so that
+        # convert() can reuse them rather than parsing the same file a second time.
+        # The stream is kept alongside the parsed file so its id cannot be recycled.
+        self._parse_cache: Dict[int, Tuple[BinaryIO, Any]] = {}
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -48,31 +180,45 @@ class OutlookMsgConverter(DocumentConverter):
             if mimetype.startswith(prefix):
                 return True
 
-        # Brute force, check if we have an OLE file
+        # Brute force, check if we have an Outlook file (impossible without olefile, or
+        # if the stream position cannot be restored afterwards)
+        if olefile is None or not file_stream.seekable():
+            return False
+
+        # Both sniffs share a single save and restore of the stream position
         cur_pos = file_stream.tell()
+        msg = None
         try:
-            if olefile and not olefile.isOleFile(file_stream):
+            # Check if we have an OLE file (OleFileIO validates the rest of the header)
+            if file_stream.read(len(OLE_MAGIC)) != OLE_MAGIC:
                 return False
-        finally:
-            file_stream.seek(cur_pos)
 
-        # Brue force, check if it's an Outlook file
-        try:
-            if olefile is not None:
-                msg = olefile.OleFileIO(file_stream)
-                toc = "\n".join([str(stream) for stream in msg.listdir()])
-                return (
-                    "__properties_version1.0" in toc
-                    and "__recip_version1.0_#00000000" in toc
-                )
+            # Check if it's an Outlook file
+            msg = olefile.OleFileIO(file_stream)
+            # Both live in the root storage of every MSG file
+            is_msg = msg.exists("__properties_version1.0") and msg.exists(
+                "__recip_version1.0_#00000000"
+            )
+            if is_msg:
+                # Hand the parsed file over to convert(), which is expected to follow
+                self._cache_ole(file_stream, msg)
+                msg = None
+            return is_msg
         except Exception as e:
             pass
         finally:
+            if msg is not None:
+                msg.close()
             file_stream.seek(cur_pos)
 
         return False
 
- 
+    def _cache_ole(self, file_stream: BinaryIO, msg: Any) -> None:
+        """Remember the OLE file parsed in accepts(), releasing any that convert() never picked up."""
+        for _, stale in self._parse_cache.values():
+            stale.close()
+        self._parse_cache.clear()
+        self._parse_cache[id(file_stream)] = (file_stream, msg)
 
     def convert(
         self,
@@ -97,131 +243,375 @@ class OutlookMsgConverter(DocumentConverter):
         assert (
             olefile is not None
         )  # If we made it this far, olefile should be available
-        msg = olefile.OleFileIO(file_stream)
+
+        # Reuse the OLE file parsed by accepts(), if any
+        cached = self._parse_cache.pop(id(file_stream), None)
+        if cached is not None and cached[0] is file_stream:
+            msg = cached[1]
+        else:
+            # olefile reads the file at random offsets. If the stream is not seekable,
+            # load it into memory once, rather than wrapping it in a read buffer
+            # (which would drift from, and on collection close, the caller's stream).
+            if not file_stream.seekable():
+                file_stream = io.BytesIO(file_stream.read())
+            msg = olefile.OleFileIO(file_stream)
+
+        try:
+            return self._convert_msg(msg)
+        finally:
+            msg.close()
+
+    def _convert_msg(self, msg: Any) -> DocumentConverterResult:
+        """Converts an already opened olefile.OleFileIO to markdown."""
 
         # Extract email metadata
-        md_content = "# Email Message\n\n"
-
-        # Get headers
-        headers = {
-            # This got wrong fields from O365 MSG: "From": self._get_stream_data(msg, "__substg1.0_0C1F001F"),
-            #Instead, get the name from '__substg1.0_0C1A001F, and then email address from __substg1.0_5D01001F
-            "From": self._get_stream_data(msg, "__substg1.0_0C1A001F") + " <" + self._get_stream_data(msg, "__substg1.0_5D01001F") + ">",
-            "To": self._get_stream_data(msg, "__substg1.0_0E04001F"),
-            "Subject": self._get_stream_data(msg, "__substg1.0_0037001F"),
+        # (the markdown is collected in parts, and joined once at the end)
+        parts = ["# Email Message\n\n"]
+
+        # Read the header and plain text body streams in one go, then decode them in memory
+        streams = self._read_streams(msg, MSG_TEXT_STREAMS)
+        fields = {
+            path: self._decode_stream_data(path, data) for path, data in streams.items()
         }
 
         # Add headers to markdown
-        for key, value in headers.items():
+        for label, stream_path, address_stream_path in MSG_HEADERS:
+            value = fields.get(stream_path)
+            address = fields.get(address_stream_path) if address_stream_path else None
+            if value and address:
+                value = f"{value} <{address}>"
+            else:
+                value = value or address
             if value:
-                md_content += f"**{key}:** {value}\n"
-
-        md_content += "\n## Content\n\n"
+                parts.append(f"**{label}:** {value}\n")
+        subject = fields.get(MSG_SUBJECT_STREAM)
 
+        parts.append("\n## Content")
 
         # Get email body (plain text) - prefer it first
-        body = self._get_stream_data(msg, "__substg1.0_1000001F")
-        if body:
-            md_content += body
-        else:
+        body = fields.get(MSG_BODY_STREAM)
+        if not body:
             # Then, secondarily prefer HTML: try to get the stream, the one which has the HTML content
-            if msg.exists("__substg1.0_10130102"):
-                # Get raw binary data directly, as we need to decode it differently
-                raw_data = msg.openstream("__substg1.0_10130102").read()
-                html_content = self._process_html_stream(raw_data)
-                if html_content and len(html_content) > 0:
-                    md_content += html_content
-        
-        msg.close()
+            # (PT_BINARY, so we get the raw data, as we need to decode it differently)
+            raw_data = self._read_streams(msg, [MSG_HTML_BODY_STREAM]).get(
+                MSG_HTML_BODY_STREAM
+            )
+            if raw_data is not None:
+                html = self._decode_html_stream(raw_data)
+                # Release the raw data (up to twice the size of the decoded HTML) before
+                # converting, so that it is not held alongside the HTML and the markdown
+                del raw_data
+                if html is not None:
+                    body = self._html_to_markdown(html).strip()
+
+        # Only the (already stripped) body is appended after the heading, so that
+        # the joined markdown needs no further stripping
+        if body:
+            parts.append("\n\n")
+            parts.append(body)
 
         return DocumentConverterResult(
-            markdown=md_content.strip(),
-            title=headers.get("Subject"),
+            markdown="".join(parts),
+            title=subject,
         )
 
-    def _get_stream_data(self, msg: Any, stream_path: str) -> Union[str, None]:
-        """Helper to safely extract and decode stream data from the MSG file."""
-        assert olefile is not None
-        assert isinstance(
-            msg, olefile.OleFileIO
-        )  # Ensure msg is of the correct type (type hinting is not possible with the optional olefile package)
+    def _read_streams(self, msg: Any, stream_paths: List[str]) -> Dict[str, bytes]:
+        """Helper to read several streams from the MSG file back-to-back.
 
-        try:
-            if msg.exists(stream_path):
-                data = msg.openstream(stream_path).read()
-
-                # Try UTF-16 first (common for .msg files)
-                try:
-                    return self._strip_null_terminator(data.decode("utf-16-le"))
-                except UnicodeDecodeError:
-                    # Fall back to UTF-8
-                    try:
-                        return self._strip_null_terminator(data.decode("utf-8"))
-                    except UnicodeDecodeError:
-                        # Last resort - ignore errors
-                        return self._strip_null_terminator(data.decode("utf-8", errors="ignore"))
-        except Exception:
-            pass
-        return None
-    
+        Streams that are missing (or cannot be read) are left out of the result.
+        (msg is an olefile.OleFileIO: type hinting is not possible with the optional olefile package)
+
+        No scratch buffer is pooled for these reads: olefile loads each stream into a
+        BytesIO, whose read() hands back that same bytes object without copying, so
+        reading into a reusable buffer would only add a copy. Instead, empty streams
+        (common for unset properties) are not opened at all.
+        """
+        streams: Dict[str, bytes] = {}
+        for stream_path in stream_paths:
+            try:
+                # Like exists(), get_size() raises if the stream is missing
+                if msg.get_size(stream_path) == 0:
+                    streams[stream_path] = b""
+                else:
+                    streams[stream_path] = msg.openstream(stream_path).read()
+            except Exception:
+                pass
+        return streams
+
+    def _decode_stream_data(self, stream_path: str, data: bytes) -> str:
+        """Decodes the data read from a MSG text stream.
+
+        The property type is encoded in the last four characters of the stream name,
+        so the encoding is picked from it rather than by trial and error:
+        - 001F (PT_UNICODE): UTF-16-LE
+        - 001E (PT_STRING8): 8-bit string, decoded as cp1252
+        Binary (0102) streams are not text: read them with _read_streams() instead.
+        """
+        prop_type = stream_path[-4:].upper()
+        if prop_type == "001F":
+            # A dangling odd byte is left undecoded (final=False), as it
+            # cannot be part of a UTF-16 code unit.
+            # There is deliberately no separate fast path for pure ASCII text (all odd
+            # bytes NUL): CPython's UTF-16-LE decoder already special-cases it, and
+            # checking data[1::2] and decoding data[::2] is several times slower.
+            text, _ = utf_16_le_decode(data, "replace")
+            return self._strip_null_terminator(text)
+        if prop_type == "001E":
+            return self._strip_null_terminator(data.decode("cp1252", errors="replace"))
+        return self._strip_null_terminator(data.decode("utf-8", errors="replace"))
 
     def _strip_null_terminator(self, text: str) -> str:
         """
-        Strips whitespace and removes trailing null character (\u0000) if present.
+        Strips whitespace and null characters (\u0000) from both ends of the string.
         (it seems that MSG files sometimes have a null in the end of the stream)
-        
+
         Args:
             text: The string to strip
-            
+
         Returns:
             The stripped string without trailing null character
         """
-        if text and text.endswith('\u0000'):
-            text = text[:-1]
-        return text.strip()
-    
-    
-    def _process_html_stream(self, raw_data: bytes) -> str:
-        """Process raw HTML stream data by trying different encodings and validating the result.
-          Unfortunately also the utf-16-le decoding works without errors even if the payload
-          is actually iso-8859-1, so we have to check if the contents look like HTML and try again
-          if the result does not look like HTML.
-
-          We finally use markdownify to convert the HTML to markdown.
-
-                  Args:
-            raw_data: The raw binary data from the HTML stream
-            
-        Returns:
-            The decoded HTML content as a markdown string
+        return text.strip(" \t\r\n\v\f\x00") if text else text
+
+    def _decode_html_stream(self, raw_data: bytes) -> Optional[str]:
         """
-        def is_valid_html(content: str) -> bool:
-            # Look for common HTML markers that should appear in valid HTML
-            markers = ['<html', '<body', '<head', '<div']
-            content_lower = content.lower()
-            return any(marker in content_lower for marker in markers)
+        Decodes the raw HTML stream data, or returns None if it does not look like HTML
+        (or is shorter than MIN_HTML_LENGTH characters).
 
-        # Try UTF-16-LE first
-        try:
-            html = self._strip_null_terminator(raw_data.decode('utf-16-le'))
-            if is_valid_html(html):
-                return Markdownify(html)
+        Unfortunately also the utf-16-le decoding works without errors even if the payload
+        is actually iso-8859-1, so the encoding is determined up front by looking for HTML
+        markers in the raw bytes (see _sniff_html), and the data is decoded only once.
+        """
+        encoding = self._sniff_html(raw_data)
+        if encoding is None:
+            return None
+        # A UTF-16-LE code unit is two bytes, an 8-bit character one
+        code_unit_size = 2 if encoding == "utf-16-le" else 1
+        if len(raw_data) < MIN_HTML_LENGTH * code_unit_size:
+            return None
+        if encoding == "utf-16-le":
+            html, _ = utf_16_le_decode(raw_data, "replace")
+        else:
+            html = raw_data.decode(encoding, errors="replace")
+        return self._strip_null_terminator(html)
+
+    def _sniff_html(self, raw_data: bytes) -> Optional[str]:
+        """
+        Returns the encoding under which the HTML stream looks like HTML, or None if it
+        does not look like HTML under any of them.
+
+        The markers are plain ASCII, so they can be looked for in the raw bytes without
+        decoding: as-is for ISO-8859-1, and with a NUL after each character for
+        UTF-16-LE. Each is a single precompiled regex, searched (without copying) in the
+        head of the stream only, since that is where the markers appear in practice.
+        """
+        for encoding, marker_re in (
+            ("utf-16-le", _HTML_MARKER_UTF16_RE),
+            ("iso-8859-1", _HTML_MARKER_RE),
+        ):
+            if marker_re.search(raw_data, 0, HTML_SNIFF_SIZE) is not None:
+                return encoding
+        return None
+
+    def _html_to_markdown(self, html: str) -> str:
+        """Converts the decoded HTML body to markdown, skipping Markdownify for plain bodies."""
+        # Plain text wrapped in <pre> is fenced as a code block, without even scanning the tags
+        # (the fence follows markdownify 1.x, which pyproject.toml pins)
+        match = _HTML_PRE_ONLY_RE.fullmatch(html)
+        if match is not None and self._unescapes_as_markdownify(match.group(1)):
+            return self._fence_pre(unescape(match.group(1))).strip("\n")
+
+        markdown = self._trivial_html_to_markdown(html)
+        if markdown is not None:
+            return markdown
+        return _get_markdown_converter().convert(html)
+
+    def _trivial_html_to_markdown(self, html: str) -> Optional[str]:
+        """
+        Converts an HTML body that uses only TRIVIAL_HTML_TAGS, as an (empty) <head> and a
+        <body> holding <p> blocks (of text and <br>) and <pre> blocks, or returns None if
+        it has any other markup or structure (in which case Markdownify has to convert it).
+
+        The result is the same as Markdownify's: text is normalized and escaped as it
+        does, <br> becomes a hard line break, and <pre> blocks are fenced.
+        """
+        blocks: List[str] = []
+        # The children of the open <p> or <pre>: text, or None for a <br>
+        children: List[Optional[str]] = []
+        element = ""
+        seen_body = False
+
+        # With its capturing groups, split() yields the text before each tag, then the groups
+        pieces = _HTML_TOKEN_RE.split(html)
+        for i in range(0, len(pieces), 4):
+            text = pieces[i]
+            if text:
+                if "<" in text or not self._unescapes_as_markdownify(text):
+                    return None
+                text = unescape(text)
+                if element != "pre" and not text.strip(HTML_ASCII_WHITESPACE):
+                    # BeautifulSoup collapses such text, as a browser would
+                    text = "\n" if "\n" in text else " "
+                if element in ("p", "pre"):
+                    children.append(text)
+                elif text.strip():
+                    return None
+                elif element != "body" and text != "\n":
+                    # Whitespace outside <body> is dropped only if it holds a line break
+                    return None
+
+            if i + 1 == len(pieces):
+                break
+            end_tag, name, self_closing = pieces[i + 1 : i + 4]
+            if name is None:
+                # A doctype
+                if element or seen_body:
+                    return None
+                continue
+            name = name.lower()
+            if self_closing and name != "br":
+                return None
+
+            if name == "br":
+                if end_tag or element != "p":
+                    return None
+                children.append(None)
+            elif name == "html":
+                if element:
+                    return None
             else:
-                # If UTF-16-LE didn't give valid HTML, try ISO-8859-1
-                html = self._strip_null_terminator(raw_data.decode('iso-8859-1'))
-                if is_valid_html(html):
-                    return Markdownify(html)
-                else:
-                    # Finally resort to utf-8, ignoring errors
-                    html = self._strip_null_terminator(raw_data.decode('utf-8', errors='ignore'))
-                    if is_valid_html(html):
-                        return Markdownify(html)
-        except UnicodeDecodeError:
-            # If UTF fails, try ISO-8859-1
-            try:
-                html = self._strip_null_terminator(raw_data.decode('iso-8859-1'))
-                if is_valid_html(html):
-                    return Markdownify(html)
-            except UnicodeDecodeError:
-                pass
-        return ""
\ No newline at end of file
+                transition = (element, end_tag + name)
+                if transition not in _TRIVIAL_HTML_TRANSITIONS or seen_body:
+                    return None
+                element = _TRIVIAL_HTML_TRANSITIONS[transition]
+                if transition == ("p", "/p"):
+                    blocks.append(self._trivial_paragraph_to_markdown(children))
+                    children = []
+                elif transition == ("pre", "/pre"):
+                    blocks.append(self._fence_pre("".join(filter(None, children))))
+                    children = []
+                elif transition == ("body", "/body"):
+                    # Whitespace in <body> is only dropped next to a block
+                    if not blocks:
+                        return None
+                    seen_body = True
+
+        if element or not seen_body:
+            return None
+        return self._join_markdown(blocks).strip("\n")
+
+    def _unescapes_as_markdownify(self, text: str) -> bool:
+        """
+        Returns whether html.unescape() decodes the character references in the text as
+        BeautifulSoup (and so Markdownify) does. They differ on references without a
+        terminating ";", unknown names, &Tab;, and control and non-characters.
+        """
+        for match in _HTML_REFERENCE_RE.finditer(text):
+            decimal, hexadecimal, name = match.groups()
+            if name is not None:
+                if name not in html5 or name == "Tab;":
+                    return False
+            elif decimal is not None or hexadecimal is not None:
+                codepoint = (
+                    int(decimal) if decimal is not None else int(hexadecimal, 16)
+                )
+                if (
+                    codepoint < 32
+                    or codepoint == 127
+                    or 0xFDD0 <= codepoint <= 0xFDEF
+                    or codepoint & 0xFFFE == 0xFFFE
+                    or codepoint > 0x10FFFF
+                ):
+                    return False
+            else:
+                return False
+        return True
+
+    def _trivial_paragraph_to_markdown(self, children: List[Optional[str]]) -> str:
+        """Converts the children of a <p> (text, or None for a <br>) as Markdownify does."""
+        converter = _get_markdown_converter()
+        strings = []
+        last = len(children) - 1
+        for i, child in enumerate(children):
+            if child is None:
+                strings.append("  \n")
+                continue
+            if not child.strip() and i in (0, last):
+                # Whitespace just inside the paragraph
+                continue
+            text = _MD_NEWLINE_WHITESPACE_RE.sub("\n", child)
+            text = _MD_WHITESPACE_RE.sub(" ", text)
+            # (escape() is missing from markdownify's type stubs)
+            text = converter.escape(text, {"p"})  # type: ignore[attr-defined]
+            if i == 0:
+                text = text.lstrip(" \t\r\n")
+            if i == last:
+                text = text.rstrip()
+            strings.append(text)
+
+        text = self._join_markdown(strings).strip(" \t\r\n")
+        return f"\n\n{text}\n\n" if text else ""
+
+    def _fence_pre(self, text: str) -> str:
+        """Fences the text of a <pre> block as a code block, as Markdownify does."""
+        if not text:
+            return ""
+        text = _MD_PRE_RSTRIP_RE.sub("", _MD_PRE_LSTRIP_RE.sub("", text))
+        return f"\n\n```\n{text}\n```\n\n"
+
+    def _join_markdown(self, strings: List[str]) -> str:
+        """
+        Joins the markdown of sibling elements as Markdownify does: where one ends and the
+        next starts with line breaks, they are collapsed into the longer run (of at most 2).
+        """
+        joined = [""]
+        for string in strings:
+            if not string:
+                continue
+            stripped = string.lstrip("\n")
+            leading = string[: len(string) - len(stripped)]
+            content = stripped.rstrip("\n")
+            trailing = stripped[len(content) :]
+            if joined[-1] and leading:
+                leading = "\n" * min(2, max(len(joined.pop()), len(leading)))
+            joined.extend((leading, content, trailing))
+        return "".join(joined)
+
+
+def _convert_one(path: str) -> DocumentConverterResult:
+    """Converts a single .msg file. Runs in a worker process of convert_many()."""
+    with open(path, "rb") as fh:
+        return OutlookMsgConverter().convert(
+            fh,
+            StreamInfo(
+                extension=".msg",
+                filename=os.path.basename(path),
+                local_path=path,
+            ),
+        )
+
+
+def convert_many(
+    paths: List[str], *, max_workers: Optional[int] = None
+) -> List[DocumentConverterResult]:
+    """
+    Converts a batch of Outlook .msg files to markdown, in parallel.
+
+    Decoding and HTML conversion are CPU-bound, so each file is converted in a worker
+    process (up to max_workers, by default one per CPU) rather than a thread.
+
+    Parameters:
+    - paths: Paths of the .msg files to convert.
+    - max_workers: Maximum number of worker processes (defaults to os.cpu_count()).
+
+    Returns:
+    - List[DocumentConverterResult]: The results, in the same order as paths.
+    """
+    if len(paths) == 0:
+        return []
+
+    # Imported here, so that importing the converter does not pay for concurrent.futures
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(_convert_one, paths, chunksize=8))
@@ -5,8 +5,14 @@ import re
 import shutil
 import openai
 import pytest
+from typing import BinaryIO, cast
 
 from markitdown._uri_utils import parse_data_uri, file_uri_to_path
+from markitdown.converters import OutlookMsgConverter
+from markitdown.converters._outlook_msg_converter import (
+    _get_markdown_converter,
+    convert_many,
+)
 
 from markitdown import (
     MarkItDown,
@@ -290,6 +296,192 @@ def test_input_as_strings() -> None:
     assert "# Test" in result.text_content
 
 
+def _outlook_msg_with_html_body(html_body: bytes) -> io.BytesIO:
+    """
+    Rewrites test_outlook_msg.msg in memory so that its only body is the given HTML:
+    the plain text body is blanked, and the transport headers stream (774 bytes) is
+    renamed to the HTML body stream and overwritten with the NUL-padded HTML.
+    """
+    import olefile
+
+    with open(os.path.join(TEST_FILES_DIR, "test_outlook_msg.msg"), "rb") as fh:
+        data = bytearray(fh.read())
+    ole = olefile.OleFileIO(bytes(data))
+    headers = ole.openstream("__substg1.0_007D001F").read()
+    body = ole.openstream("__substg1.0_1000001F").read()
+    ole.close()
+
+    assert len(html_body) <= len(headers)
+    for old, new in [
+        (headers, html_body.ljust(len(headers), b"\x00")),
+        (body, bytes(len(body))),
+        (
+            "__substg1.0_007D001F".encode("utf-16-le"),
+            "__substg1.0_10130102".encode("utf-16-le"),
+        ),
+    ]:
+        assert data.count(old) == 1
+        start = data.find(old)
+        data[start : start + len(old)] = new
+    return io.BytesIO(bytes(data))
+
+
+def test_outlook_msg_html_body() -> None:
+    converter = OutlookMsgConverter()
+
+    def convert_html_body(html_body: bytes) -> str:
+        result = converter.convert(
+            _outlook_msg_with_html_body(html_body), StreamInfo(extension=".msg")
+        )
+        assert result.title == "Test Email Message"
+        heading, _, body = result.markdown.partition("\n## Content")
+        assert heading.startswith("# Email Message")
+        assert body == "" or body.startswith("\n\n")
+        return body[2:]
+
+    # The HTML body stream may be UTF-16-LE or an 8-bit encoding
+    html = "<html><body><div>Hello <b>W\u00f6rld</b></div></body></html>"
+    for encoding in ["utf-16-le", "iso-8859-1"]:
+        assert convert_html_body(html.encode(encoding)) == "Hello **W\u00f6rld**"
+
+    # Bodies that do not look like HTML are dropped
+    assert convert_html_body(b"Not HTML at all, just some bytes") == ""
+
+    # Short bodies are measured in characters, not bytes (31 bytes as 8-bit text)
+    html = "<html><body>Hello</body></html>"
+    for encoding in ["utf-16-le", "iso-8859-1"]:
+        assert converter._decode_html_stream(html.encode(encoding)) == html
+        assert convert_html_body(html.encode(encoding)) == "Hello"
+    assert converter._decode_html_stream("<html></html>".encode("utf-16-le")) is None
+
+    # Bodies with only trivial markup are converted without Markdownify
+    html = (
+        "<html><body><p>Line  one<br>Line two</p><pre>  a &lt; b\n</pre></body></html>"
+    )
+    markdown = convert_html_body(html.encode("utf-16-le"))
+    assert markdown == "Line one  \nLine two\n\n```\n  a < b\n```"
+
+    # Plain text pasted into a <pre> block is fenced as a code block, as Markdownify does
+    html = "<html>\n<body>\n<pre>\n*Not* markdown &amp; kept as-is\n</pre>\n</body>\n</html>"
+    markdown = convert_html_body(html.encode("iso-8859-1"))
+    assert markdown == "```\n*Not* markdown & kept as-is\n```"
+    assert markdown == _get_markdown_converter().convert(html)
+
+    # Unless html.unescape() would decode its references differently than Markdownify
+    html = "<html><body><pre>a=1&lang=en &pound5</pre></body></html>"
+    markdown = convert_html_body(html.encode("iso-8859-1"))
+    assert markdown == _get_markdown_converter().convert(html)
+
+
+def test_outlook_msg_trivial_html() -> None:
+    converter = OutlookMsgConverter()
+    markdown_converter = _get_markdown_converter()
+
+    # The shortcut for trivial HTML bodies must give the same markdown as Markdownify
+    for html in [
+        "<html><body><p>*urgent* _x_</p></body></html>",
+        "<html><body><p>Line  one<br>Line two</p><pre>  a &lt; b\n</pre></body></html>",
+        "<!DOCTYPE html>\n<html>\n<head>\n</head>\n<body>\n<p>\n  Hello,<br>\n  world &amp; all\n</p>\n\n<p>Second<br/><br/> paragraph&nbsp;</p>\n</body>\n</html>\n",
+        '<html><body><P class="MsoNormal">a<BR clear=all>b</P><pre>\n\n</pre><p> </p></body></html>',
+        "<html><body><p>&lt;a&gt; &quot;&#39;&#x2019;&#8364;&#150;&eacute;</p></body></html>",
+        "<html><body><p>a<br>\x0c<br>b\x0c</p></body></html>",
+    ]:
+        markdown = converter._trivial_html_to_markdown(html)
+        assert markdown is not None
+        assert markdown == markdown_converter.convert(html)
+
+    # Any other markup is left to Markdownify
+    for html in [
+        "<html><body><p>Hello <b>world</b></p></body></html>",
+        "<html><body><p>Hello</p><!-- comment --></body></html>",
+        "<html><body>Text outside a paragraph</body></html>",
+        "<html><body><p>Unclosed</body></html>",
+        # html.unescape() and BeautifulSoup decode these references differently
+        "<html><body><p>x.com/?a=1&lang=en &pound5 x&times2 &ampx</p></body></html>",
+        "<html><body><p>&foo; &Tab; &#1; &#xFFFF;</p></body></html>",
+    ]:
+        assert converter._trivial_html_to_markdown(html) is None
+
+
+def test_outlook_msg_parse_cache() -> None:
+    import olefile
+
+    converter = OutlookMsgConverter()
+    with open(os.path.join(TEST_FILES_DIR, "test_outlook_msg.msg"), "rb") as fh:
+        stream = io.BytesIO(fh.read())
+
+    # Without hints, accepts() parses the OLE file, and hands it over to convert()
+    assert converter.accepts(stream, StreamInfo())
+    assert stream.tell() == 0
+    assert [cached[0] for cached in converter._parse_cache.values()] == [stream]
+
+    # Count the OLE files convert() opens itself
+    opened = []
+    ole_file_io = olefile.OleFileIO
+
+    def counting_ole_file_io(*args, **kwargs):
+        opened.append(args)
+        return ole_file_io(*args, **kwargs)
+
+    olefile.OleFileIO = counting_ole_file_io
+    try:
+        result = converter.convert(stream, StreamInfo())
+    finally:
+        olefile.OleFileIO = ole_file_io
+    assert opened == []
+    assert result.title == "Test Email Message"
+    assert converter._parse_cache == {}
+
+    # OLE files that are not MSG files (here an Excel workbook) are not kept
+    with open(os.path.join(TEST_FILES_DIR, "test.xls"), "rb") as fh:
+        assert not converter.accepts(fh, StreamInfo())
+        assert fh.tell() == 0
+    assert converter._parse_cache == {}
+
+
+class _NonSeekableStream(io.RawIOBase):
+    """A read-only stream that cannot seek, like a pipe or a socket."""
+
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._stream.readinto(buffer)
+
+
+def test_outlook_msg_non_seekable() -> None:
+    converter = OutlookMsgConverter()
+    with open(os.path.join(TEST_FILES_DIR, "test_outlook_msg.msg"), "rb") as fh:
+        data = fh.read()
+
+    # Without hints, a non-seekable stream cannot be sniffed (nor rewound afterwards)
+    stream = cast(BinaryIO, _NonSeekableStream(data))
+    assert not stream.seekable()
+    assert not converter.accepts(stream, StreamInfo())
+    assert converter._parse_cache == {}
+
+    # But it can still be converted
+    stream = cast(BinaryIO, _NonSeekableStream(data))
+    result = converter.convert(stream, StreamInfo(extension=".msg"))
+    assert result.title == "Test Email Message"
+    assert "**To:** test.recipient@example.com" in result.markdown
+    assert "This is the body of the test email message" in result.markdown
+    assert not stream.closed
+
+
+def test_outlook_msg_convert_many() -> None:
+    msg_file = os.path.join(TEST_FILES_DIR, "test_outlook_msg.msg")
+    results = convert_many([msg_file] * 3, max_workers=2)
+
+    assert len(results) == 3
+    for result in results:
+        assert result.title == "Test Email Message"
+        assert "This is the body of the test email message" in result.markdown
+
+
 @pytest.mark.skipif(
     skip_remote,
     reason="do not run tests that query external urls",
@@ -407,6 +599,11 @@ if __name__ == "__main__":
         test_file_uris,
         test_docx_comments,
         test_input_as_strings,
+        test_outlook_msg_html_body,
+        test_outlook_msg_trivial_html,
+        test_outlook_msg_parse_cache,
+        test_outlook_msg_non_seekable,
+        test_outlook_msg_convert_many,
         test_markitdown_remote,
         test_speech_transcription,
         test_exceptions,